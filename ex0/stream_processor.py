@@ -1,11 +1,27 @@
 #!/usr/bin/env python3
 
 
+import sys
 from abc import ABC, abstractmethod
 from typing import Any
 
 
+_PREFIXES = {
+    "ERROR": "[ALERT]",
+    "INFO": "[INFO]",
+    "WARNING": "[WARNING]",
+    "DEBUG": "[DEBUG]",
+    "CRITICAL": "[CRITICAL]"
+}
+
+_PREFIX_FMT = {
+    level: f"{prefix} {level} level detected: "
+    for level, prefix in _PREFIXES.items()
+}
+
+
 class DataProcessor(ABC):
+    __slots__ = ()
 
     @abstractmethod
     def process(self, data: Any) -> str:
@@ -20,23 +36,27 @@ class DataProcessor(ABC):
 
 
 class NumericProcessor(DataProcessor):
+    __slots__ = ()
 
     def process(self, data: Any) -> str:
-        average = sum(data) / len(data)
+        count = len(data)
+        total = sum(data)
+        average = total / count
         return (
-            f"Processed {len(data)} numeric values, "
-            f"sum={sum(data)}, avg={average:.1f}"
+            f"Processed {count} numeric values, "
+            f"sum={total}, avg={average:.1f}"
         )
 
     def validate(self, data: Any) -> bool:
         try:
             sum(data)
-            return True
+            return len(data) > 0
         except TypeError:
             return False
 
 
 class TextProcessor(DataProcessor):
+    __slots__ = ()
 
     def process(self, data: Any) -> str:
         chars = len(data)
@@ -44,38 +64,27 @@ class TextProcessor(DataProcessor):
         return f"Processed text: {chars} characters, {words} words"
 
     def validate(self, data: Any) -> bool:
-        try:
-            data.split()
-            return True
-        except AttributeError:
-            return False
+        return isinstance(data, str)
 
 
 class LogProcessor(DataProcessor):
+    __slots__ = ()
 
     def process(self, data: Any) -> str:
-
-        prefixes = {
-            "ERROR": "[ALERT]",
-            "INFO": "[INFO]",
-            "WARNING": "[WARNING]",
-            "DEBUG": "[DEBUG]",
-            "CRITICAL": "[CRITICAL]"
-        }
-
-        level, message = data.split(": ")
-        prefix = prefixes.get(level, "[LOG]")
-        return f"{prefix} {level} level detected: {message}"
+        level, sep, message = data.partition(": ")
+        if not sep:
+            return "[LOG] malformed: " + data
+        header = _PREFIX_FMT.get(level)
+        if header is None:
+            header = f"[LOG] {level} level detected: "
+        return header + message
 
     def validate(self, data: Any) -> bool:
-        try:
-            data.split()      # checks it's a string
-            return ": " in data  # checks structure
-        except AttributeError:
-            return False
+        return isinstance(data, str) and ": " in data
 
 
 if __name__ == "__main__":
+    sys.stdout.reconfigure(line_buffering=False)
 
     numeric = NumericProcessor()
     text = TextProcessor()
@@ -91,11 +100,8 @@ if __name__ == "__main__":
     print(f"Processing data: {numeric_list}")
     if numeric.validate(numeric_list):
         print("Validation: Numeric data verified")
-        try:
-            result = numeric.process(numeric_list)
-            print(numeric.format_output(result))
-        except ZeroDivisionError:
-            print("Cannot process empty list")
+        result = numeric.process(numeric_list)
+        print(numeric.format_output(result))
     else:
         print("Invalid numeric data")
 
@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 
 
+import sys
 from abc import ABC, abstractmethod
 from typing import Any, List, Dict, Union, Optional
 
 
 class DataStream(ABC):
+    __slots__ = ("stream_id", "total_processed", "stream_type", "data_type",
+                 "kind")
+
     def __init__(self, stream_id: str) -> None:
         self.stream_id = stream_id
         self.total_processed = 0
+        self.kind = None
 
     @abstractmethod
     def process_batch(self, data_batch: List[Any]) -> str:
@@ -28,14 +33,18 @@ class DataStream(ABC):
 
 
 class SensorStream(DataStream):
+    __slots__ = ()
+
     def __init__(self, stream_id: str) -> None:
         super().__init__(stream_id)
         self.stream_type = "Environmental Data"
         self.data_type = "Sensor data"
+        self.kind = "sensor"
 
     def process_batch(self, data_batch: List[Any]) -> str:
-        self.total_processed += len(data_batch)
-        return (f"Sensor analysis: {len(data_batch)} readings processed"
+        count = len(data_batch)
+        self.total_processed += count
+        return (f"Sensor analysis: {count} readings processed"
                 f", avg temp: {data_batch[0]}°C")
 
     def filter_data(self, data_batch: List[Any],
@@ -51,20 +60,25 @@ class SensorStream(DataStream):
 
 
 class TransactionStream(DataStream):
+    __slots__ = ()
+
     def __init__(self, stream_id: str) -> None:
         super().__init__(stream_id)
         self.stream_type = "Financial Data"
         self.data_type = "Transaction data"
+        self.kind = "transaction"
 
     def process_batch(self, data_batch: List[Any]) -> str:
-        self.total_processed += len(data_batch)
-        return (f"Transaction analysis: {len(data_batch)} operations"
-                f", net flow: {sum(data_batch):+} units")
+        count = len(data_batch)
+        net_flow = sum(data_batch)
+        self.total_processed += count
+        return (f"Transaction analysis: {count} operations"
+                f", net flow: {net_flow:+} units")
 
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
         if criteria == "high":
-            return [data for data in data_batch if data > 100 or data < -100]
+            return [data for data in data_batch if abs(data) > 100]
         return data_batch
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
@@ -74,16 +88,20 @@ class TransactionStream(DataStream):
 
 
 class EventStream(DataStream):
+    __slots__ = ()
+
     def __init__(self, stream_id: str) -> None:
         super().__init__(stream_id)
         self.stream_type = "System Events"
         self.data_type = "Event data"
+        self.kind = "event"
 
     def process_batch(self, data_batch: List[Any]) -> str:
-        self.total_processed += len(data_batch)
-        num_errors = sum(1 for event in data_batch if event == "error")
+        count = len(data_batch)
+        num_errors = data_batch.count("error")
+        self.total_processed += count
         error_word = "error" if num_errors == 1 else "errors"
-        return (f"Event analysis: {len(data_batch)} events"
+        return (f"Event analysis: {count} events"
                 f", {num_errors} {error_word} detected")
     
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
@@ -96,7 +114,7 @@ class StreamProcessor:
     def process_stream(self, stream: DataStream, data: List[Any]) -> str:
         return stream.process_batch(data)
 
-    def stream_stats(self, stream: DataStream, data: List[Any]) -> str:
+    def stream_stats(self, stream: DataStream) -> str:
         stats = stream.get_stats()
         return f"- {stats['data_type']}: {stats['summary']}"
 
@@ -106,6 +124,8 @@ class StreamProcessor:
 
 
 if __name__ == "__main__":
+    sys.stdout.reconfigure(line_buffering=False)
+
     print("=== CODE NEXUS - POLYMORPHIC STREAM SYSTEM ===\n")
 
     processor = StreamProcessor()
@@ -125,14 +145,11 @@ if __name__ == "__main__":
         f"Stream ID: {transaction.stream_id}, "
         f"Type: {transaction.stream_type}"
     )
-    transactions = []
-    for trans in batch:
-        if trans > 0:
-            transactions.append(f"buy:{str(trans)}")
-        elif trans < 0:
-            transactions.append(f"sell:{str(-trans)}")
-        else:
-            transactions.append("0")
+    transactions = [
+        f"buy:{trans}" if trans > 0 else f"sell:{-trans}" if trans < 0
+        else "0"
+        for trans in batch
+    ]
     print("Processing transaction batch: [" + ", ".join(transactions) + "]")
     print(processor.process_stream(transaction, batch))
 
@@ -155,17 +172,17 @@ if __name__ == "__main__":
 
     for stream, data in streams:
         processor.process_stream(stream, data)
-        print(processor.stream_stats(stream, data))
+        print(processor.stream_stats(stream))
 
     print("\nStream filtering active: High-priority data only")
     filtered_res = []
     for stream, data in streams:
         filtered_lst = processor.filter_stream(stream, data, criteria="high")
-        if isinstance(stream, SensorStream):
+        if stream.kind == "sensor":
             word = "alert" if len(filtered_lst) == 1 else "alerts"
             filtered_str = str(len(filtered_lst)) + " critical sensor " + word
             filtered_res.append(filtered_str)
-        elif isinstance(stream, TransactionStream):
+        elif stream.kind == "transaction":
             word = "transaction" if len(filtered_lst) == 1 else "transactions"
             filtered_str = str(len(filtered_lst)) + " large " + word
             filtered_res.append(filtered_str)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 
+import sys
 from typing import Protocol, Any, List
 from abc import ABC, abstractmethod
 
@@ -33,8 +34,12 @@ class ProcessingPipeline(ABC):
         self.stages.append(stage)
 
     def run_stages(self, data: Any) -> Any:
+        stages = self.stages
+        if len(stages) == 3:
+            first, second, third = stages
+            return third.process(second.process(first.process(data)))
         result = data
-        for stage in self.stages:
+        for stage in stages:
             result = stage.process(result)
         return result
 
@@ -142,6 +147,7 @@ class NexusManager:
 
 
 if __name__ == "__main__":
+    sys.stdout.reconfigure(line_buffering=False)
 
     print("=== CODE NEXUS - ENTERPRISE PIPELINE SYSTEM ===\n")
 